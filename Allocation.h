@@ -4,7 +4,7 @@
  * This module implements priority-based greedy allocation:
  * 1. Sort nodes by priority (descending)
  * 2. For each node, assign to vehicle with minimum extra cost
- * 3. Use Dijkstra to compute shortest paths
+ * 3. Use Dijkstra to compute shortest paths (once per vehicle position)
  */
 
 #ifndef ALLOCATION_H
@@ -51,38 +51,54 @@ struct Vehicle {
 
 /**
  * Priority-Based Greedy Allocation
- * Time Complexity: O(V * V * log V) for Dijkstra calls
+ * Time Complexity: O(V * (V + E) log V) for Dijkstra runs (one each time
+ *                  a vehicle moves), plus O(V * K) lookups for K vehicles
+ * Space Complexity: O(K * V) - one distance row per vehicle
  * 
  * Algorithm:
  * 1. Sort all nodes by priority (descending) - higher priority first
  * 2. For each high-priority node:
  *    - Find vehicle with minimum extra cost to serve it
- *    - Use Dijkstra to compute shortest path from vehicle's last position
+ *    - Look up shortest path from vehicle's last position in that
+ *      vehicle's distance row, recomputed only when the position changes
  *    - Assign node to best vehicle
  */
 vector<Vehicle> allocateVehicles(const Graph& graph, 
                                  const vector<Vehicle>& vehicles) {
     vector<Vehicle> assignedVehicles = vehicles;
     
-    // Get all nodes except depot (node 0) that have demand
-    vector<int> nodesToAssign;
+    // Get all nodes except depot (node 0) that have demand, paired with
+    // their priority so sorting does not look nodes up on every comparison
+    vector<pair<int, int>> prioritizedNodes;  // (priority, node_id)
     for (int nodeId : graph.getAllNodeIds()) {
         if (nodeId != 0) {
             const Node* node = graph.getNode(nodeId);
             if (node && node->demand > 0) {
-                nodesToAssign.push_back(nodeId);
+                prioritizedNodes.push_back({node->priority, nodeId});
             }
         }
     }
     
-    // Sort nodes by priority (descending) - highest priority first
-    sort(nodesToAssign.begin(), nodesToAssign.end(),
-         [&graph](int a, int b) {
-             const Node* nodeA = graph.getNode(a);
-             const Node* nodeB = graph.getNode(b);
-             if (!nodeA || !nodeB) return false;
-             return nodeA->priority > nodeB->priority;
-         });
+    // Sort nodes by priority (descending) - highest priority first;
+    // the stable sort keeps ties in the order the nodes were added
+    stable_sort(prioritizedNodes.begin(), prioritizedNodes.end(),
+                [](const pair<int, int>& a, const pair<int, int>& b) {
+                    return a.first > b.first;
+                });
+    
+    vector<int> nodesToAssign;
+    nodesToAssign.reserve(prioritizedNodes.size());
+    for (const auto& entry : prioritizedNodes) {
+        nodesToAssign.push_back(entry.second);
+    }
+    
+    // Shortest path distances from each vehicle's last node, indexed by
+    // graph.indexOf; a row is only recomputed when its vehicle moves,
+    // instead of re-running Dijkstra for every (node, vehicle) pair
+    int numVehicles = (int)assignedVehicles.size();
+    vector<vector<double>> distanceRows(numVehicles);
+    vector<int> rowSource(numVehicles);
+    vector<char> hasRow(numVehicles, 0);
     
     // Assign nodes to vehicles using greedy approach
     for (int nodeId : nodesToAssign) {
@@ -104,15 +120,22 @@ vector<Vehicle> allocateVehicles(const Graph& graph,
             // Get last node in vehicle's current route
             int lastNode = vehicle.route.back();
             
-            // Compute shortest path cost from last node to new node using Dijkstra
-            unordered_map<int, double> distances = dijkstra(graph, lastNode);
-            
-            // Get distance to target node
-            double extraCost = numeric_limits<double>::max();
-            if (distances.find(nodeId) != distances.end()) {
-                extraCost = distances[nodeId];
+            // Refresh this vehicle's row if it has moved, reusing another
+            // vehicle's row from the same node (e.g. the depot) if there is one
+            if (!hasRow[i] || rowSource[i] != lastNode) {
+                int shared = -1;
+                for (int j = 0; j < numVehicles && shared < 0; j++) {
+                    if (j != i && hasRow[j] && rowSource[j] == lastNode) shared = j;
+                }
+                distanceRows[i] = shared >= 0 ? distanceRows[shared]
+                                              : dijkstraDistances(graph, lastNode);
+                rowSource[i] = lastNode;
+                hasRow[i] = 1;
             }
             
+            // Look up shortest path cost from last node to new node
+            double extraCost = distanceRows[i][graph.indexOf(nodeId)];
+            
             // Update best vehicle if this one has lower cost
             if (extraCost < minExtraCost && 
                 extraCost < numeric_limits<double>::max()) {
@@ -58,10 +58,10 @@ RouteCost calculateRouteCost(const Graph& graph,
         int u = route[i];
         int v = route[i + 1];
         
-        double edgeCost = graph.getEdgeCost(u, v);
-        double edgeReliability = graph.getEdgeReliability(u, v);
+        double edgeCost = 0.0;
+        double edgeReliability = 0.0;
         
-        if (edgeCost >= 0) {
+        if (graph.getEdgeAttributes(u, v, edgeCost, edgeReliability)) {
             cost.totalTime += edgeCost;
             totalReliability *= edgeReliability;
         }
@@ -17,30 +17,33 @@
 #include <limits>
 #include <algorithm>
 #include <cmath>
+#include <thread>
+#include <mutex>
+#include <exception>
+#include <functional>
 
 using namespace std;
 
 /**
- * Dijkstra's Algorithm
+ * Dijkstra's Algorithm on arrays indexed by the graph's dense node index
  * Time Complexity: O((V + E) log V) using priority queue
- * Returns: unordered_map of minimum distances from source to all reachable nodes
+ * Returns: vector of minimum distances indexed by graph.indexOf(node ID),
+ *          with numeric_limits<double>::max() for unreachable nodes
  */
-unordered_map<int, double> dijkstra(const Graph& graph, int source) {
-    unordered_map<int, double> distMap;
-    unordered_map<int, bool> visited;
+vector<double> dijkstraDistances(const Graph& graph, int source) {
+    int count = graph.numIndices();
+    vector<double> dist(count, numeric_limits<double>::max());
+    vector<char> visited(count, 0);
     
-    // Initialize distances to infinity for all nodes
-    for (int nodeId : graph.getAllNodeIds()) {
-        distMap[nodeId] = numeric_limits<double>::max();
-        visited[nodeId] = false;
-    }
-    distMap[source] = 0.0;
+    int sourceIndex = graph.indexOf(source);
+    if (sourceIndex < 0) return dist;
+    dist[sourceIndex] = 0.0;
     
-    // Priority queue: (distance, node_id) - smaller distance has higher priority
+    // Priority queue: (distance, node index) - smaller distance has higher priority
     priority_queue<pair<double, int>, 
                    vector<pair<double, int>>,
                    greater<pair<double, int>>> pq;
-    pq.push({0.0, source});
+    pq.push({0.0, sourceIndex});
     
     while (!pq.empty()) {
         int u = pq.top().second;
@@ -48,24 +51,86 @@ unordered_map<int, double> dijkstra(const Graph& graph, int source) {
         
         // Skip if already visited
         if (visited[u]) continue;
-        visited[u] = true;
+        visited[u] = 1;
         
         // Check all neighbors of current node
-        for (const auto& neighbor : graph.getNeighbors(u)) {
-            int v = neighbor.first;
-            double edgeCost = neighbor.second.cost;
+        const auto& neighbors = graph.getNeighborsAt(u);
+        const vector<int>& neighborIndices = graph.getNeighborIndices(u);
+        for (int k = 0; k < (int)neighbors.size(); k++) {
+            int v = neighborIndices[k];
+            double edgeCost = neighbors[k].second.cost;
             
             // Update distance if we found a shorter path
-            if (!visited[v] && distMap[u] + edgeCost < distMap[v]) {
-                distMap[v] = distMap[u] + edgeCost;
-                pq.push({distMap[v], v});
+            if (!visited[v] && dist[u] + edgeCost < dist[v]) {
+                dist[v] = dist[u] + edgeCost;
+                pq.push({dist[v], v});
             }
         }
     }
     
+    return dist;
+}
+
+/**
+ * Dijkstra's Algorithm
+ * Time Complexity: O((V + E) log V) using priority queue
+ * Returns: unordered_map of minimum distances from source to all reachable nodes
+ */
+unordered_map<int, double> dijkstra(const Graph& graph, int source) {
+    vector<double> dist = dijkstraDistances(graph, source);
+    unordered_map<int, double> distMap;
+    
+    for (int nodeId : graph.getAllNodeIds()) {
+        distMap[nodeId] = dist[graph.indexOf(nodeId)];
+    }
+    
     return distMap;
 }
 
+/**
+ * Run task(0) .. task(count - 1) on at most hardware_concurrency threads
+ * Worker w handles items w, w + numWorkers, ...; tasks must only write
+ * state owned by their own item. The first exception from a task, or from
+ * starting a thread, is rethrown once every started worker has joined
+ */
+void parallelFor(int count, const function<void(int)>& task) {
+    int numWorkers = (int)max(1u, thread::hardware_concurrency());
+    numWorkers = min(numWorkers, count);
+    if (numWorkers <= 1) {
+        for (int i = 0; i < count; i++) task(i);
+        return;
+    }
+    
+    exception_ptr error;
+    mutex errorMutex;
+    auto recordError = [&error, &errorMutex]() {
+        lock_guard<mutex> lock(errorMutex);
+        if (!error) error = current_exception();
+    };
+    
+    vector<thread> workers;
+    try {
+        for (int w = 0; w < numWorkers; w++) {
+            workers.emplace_back([&task, &recordError, count, w, numWorkers]() {
+                try {
+                    for (int i = w; i < count; i += numWorkers) {
+                        task(i);
+                    }
+                } catch (...) {
+                    recordError();
+                }
+            });
+        }
+    } catch (...) {
+        recordError();
+    }
+    for (auto& worker : workers) {
+        worker.join();
+    }
+    
+    if (error) rethrow_exception(error);
+}
+
 /**
  * A* Search Algorithm
  * Time Complexity: O((V + E) log V) in worst case
@@ -138,12 +203,21 @@ vector<int> astar(const Graph& graph, int source, int target) {
  * 2-Opt Route Optimization
  * Time Complexity: O(n^2) per iteration, typically converges quickly
  * Improves route by reversing segments when it reduces total cost
+ * Each candidate reversal is scored in O(1): the graph is undirected, so
+ * only the two edges at the segment boundaries change
  * Returns: optimized route
  */
 vector<int> twoOpt(const Graph& graph, const vector<int>& route) {
     // Routes with 3 or fewer nodes can't be optimized
     if (route.size() <= 3) return route;
     
+    // Routes using a missing edge can't be costed, so leave them unchanged
+    for (int k = 0; k < (int)route.size() - 1; k++) {
+        if (graph.getEdgeCost(route[k], route[k + 1]) < 0) {
+            return route;
+        }
+    }
+    
     vector<int> bestRoute = route;
     bool improved = true;
     
@@ -154,38 +228,22 @@ vector<int> twoOpt(const Graph& graph, const vector<int>& route) {
         // Try all possible segment reversals
         for (int i = 1; i < (int)bestRoute.size() - 2; i++) {
             for (int j = i + 1; j < (int)bestRoute.size() - 1; j++) {
-                // Calculate current route cost
-                double currentCost = 0.0;
-                bool currentValid = true;
-                for (int k = 0; k < (int)bestRoute.size() - 1; k++) {
-                    double cost = graph.getEdgeCost(bestRoute[k], bestRoute[k + 1]);
-                    if (cost < 0) {
-                        currentValid = false;
-                        break;
-                    }
-                    currentCost += cost;
-                }
-                if (!currentValid) continue;
+                int before = bestRoute[i - 1];
+                int first = bestRoute[i];
+                int last = bestRoute[j];
+                int after = bestRoute[j + 1];
                 
-                // Try reversing segment from i to j
-                vector<int> newRoute = bestRoute;
-                reverse(newRoute.begin() + i, newRoute.begin() + j + 1);
+                // New boundary edges must exist for the reversal to be valid
+                double newIn = graph.getEdgeCost(before, last);
+                double newOut = graph.getEdgeCost(first, after);
+                if (newIn < 0 || newOut < 0) continue;
                 
-                // Calculate new route cost
-                double newCost = 0.0;
-                bool valid = true;
-                for (int k = 0; k < (int)newRoute.size() - 1; k++) {
-                    double cost = graph.getEdgeCost(newRoute[k], newRoute[k + 1]);
-                    if (cost < 0) {
-                        valid = false;
-                        break;
-                    }
-                    newCost += cost;
-                }
+                double oldIn = graph.getEdgeCost(before, first);
+                double oldOut = graph.getEdgeCost(last, after);
                 
-                // If new route is better, use it
-                if (valid && newCost < currentCost) {
-                    bestRoute = newRoute;
+                // If reversing segment from i to j is cheaper, use it
+                if (newIn + newOut < oldIn + oldOut) {
+                    reverse(bestRoute.begin() + i, bestRoute.begin() + j + 1);
                     improved = true;
                     break;
                 }
@@ -12,6 +12,7 @@
 #include <vector>
 #include <unordered_map>
 #include <string>
+#include <algorithm>
 
 using namespace std;
 
@@ -39,77 +40,170 @@ struct Edge {
 };
 
 // Graph class using adjacency list representation
+// Node IDs are arbitrary ints; each one is mapped once to a dense index
+// (0..V-1, in order of first appearance) and per-node storage is kept in
+// vectors by that index, so memory grows with the node count, not the IDs
 // Time complexity: O(V + E) for construction, O(1) for neighbor queries
+// and O(1) average for edge lookups between two nodes
 class Graph {
 private:
-    unordered_map<int, Node> nodes;
-    unordered_map<int, vector<pair<int, Edge>>> adjacencyList;
+    unordered_map<int, int> indexOfId;              // Node ID -> dense index
+    vector<int> idOfIndex;                          // Dense index -> node ID
+    vector<Node> nodes;                             // Indexed by dense index
+    vector<char> hasNode;                           // Whether nodes[index] was added
+    vector<int> nodeIds;                            // Added IDs in insertion order
+    vector<vector<pair<int, Edge>>> adjacencyList;  // Indexed by dense index
+    vector<vector<int>> neighborIndices;            // Dense indices, aligned with adjacencyList
     vector<Edge> edges;
+    
+    // Edges are undirected, so an edge is indexed once under its unordered
+    // pair {u, v}, which halves the index compared to one key per direction
+    unordered_map<long long, int> edgeIndex;  // {u, v} key -> index into edges
+    
+    // Get the dense index of a node ID, assigning the next one if it is new
+    // (a single hash lookup both finds and inserts)
+    int ensureIndex(int nodeId) {
+        auto [it, inserted] = indexOfId.try_emplace(nodeId, (int)idOfIndex.size());
+        if (!inserted) return it->second;
+        
+        int index = it->second;
+        idOfIndex.push_back(nodeId);
+        nodes.emplace_back();
+        hasNode.push_back(0);
+        adjacencyList.emplace_back();
+        neighborIndices.emplace_back();
+        return index;
+    }
+    
+    // Pack an unordered node pair into a single hash key
+    static long long edgeKey(int u, int v) {
+        unsigned long long high = (unsigned int)min(u, v);
+        return (long long)((high << 32) | (unsigned int)max(u, v));
+    }
+    
+    // Find the first edge added between two nodes, or nullptr
+    const Edge* findEdge(int u, int v) const {
+        auto it = edgeIndex.find(edgeKey(u, v));
+        if (it != edgeIndex.end()) {
+            return &edges[it->second];
+        }
+        return nullptr;
+    }
 
 public:
     Graph() = default;
     
     // Add a node to the graph
     void addNode(const Node& node) {
-        nodes[node.id] = node;
-        if (adjacencyList.find(node.id) == adjacencyList.end()) {
-            adjacencyList[node.id] = vector<pair<int, Edge>>();
+        int index = ensureIndex(node.id);
+        
+        nodes[index] = node;
+        if (!hasNode[index]) {
+            hasNode[index] = 1;
+            nodeIds.push_back(node.id);
         }
     }
     
+    // Reserve storage for a known number of nodes, avoiding regrowth
+    void reserveNodes(int count) {
+        indexOfId.reserve(count);
+        idOfIndex.reserve(count);
+        nodes.reserve(count);
+        hasNode.reserve(count);
+        nodeIds.reserve(count);
+        adjacencyList.reserve(count);
+        neighborIndices.reserve(count);
+    }
+    
+    // Reserve storage for a known number of edges, avoiding regrowth
+    void reserveEdges(int count) {
+        edges.reserve(count);
+        edgeIndex.reserve(count);
+    }
+    
     // Add an edge to the graph (undirected)
     void addEdge(const Edge& edge) {
+        int indexU = ensureIndex(edge.u);
+        int indexV = ensureIndex(edge.v);
+        int index = (int)edges.size();
         edges.push_back(edge);
         
+        // Index the pair once; keep the first edge if duplicates exist
+        edgeIndex.emplace(edgeKey(edge.u, edge.v), index);
+        
         // Add to adjacency list for both directions (undirected graph)
-        adjacencyList[edge.u].push_back({edge.v, edge});
-        adjacencyList[edge.v].push_back({edge.u, edge});
+        adjacencyList[indexU].push_back({edge.v, edge});
+        neighborIndices[indexU].push_back(indexV);
+        adjacencyList[indexV].push_back({edge.u, edge});
+        neighborIndices[indexV].push_back(indexU);
+    }
+    
+    // Get the dense index of a node ID, or -1 if the graph has not seen it
+    int indexOf(int nodeId) const {
+        auto it = indexOfId.find(nodeId);
+        return it != indexOfId.end() ? it->second : -1;
+    }
+    
+    // Get the node ID at a dense index
+    int idOf(int index) const {
+        return idOfIndex[index];
     }
     
     // Get all neighbors of a node
     const vector<pair<int, Edge>>& getNeighbors(int nodeId) const {
         static const vector<pair<int, Edge>> empty;
-        auto it = adjacencyList.find(nodeId);
-        if (it != adjacencyList.end()) {
-            return it->second;
-        }
-        return empty;
+        int index = indexOf(nodeId);
+        return index >= 0 ? adjacencyList[index] : empty;
+    }
+    
+    // Get the neighbors of the node at a dense index
+    const vector<pair<int, Edge>>& getNeighborsAt(int index) const {
+        return adjacencyList[index];
+    }
+    
+    // Get the dense indices of those neighbors, in the same order
+    const vector<int>& getNeighborIndices(int index) const {
+        return neighborIndices[index];
     }
     
     // Get node by ID
     const Node* getNode(int nodeId) const {
-        auto it = nodes.find(nodeId);
-        if (it != nodes.end()) {
-            return &(it->second);
+        int index = indexOf(nodeId);
+        if (index >= 0 && hasNode[index]) {
+            return &nodes[index];
         }
         return nullptr;
     }
     
-    // Get all node IDs
+    // Get all node IDs (in the order they were added)
     vector<int> getAllNodeIds() const {
-        vector<int> ids;
-        for (const auto& pair : nodes) {
-            ids.push_back(pair.first);
-        }
-        return ids;
+        return nodeIds;
+    }
+    
+    // Get cost and reliability of the edge between two nodes in one lookup
+    // Returns false (leaving outputs untouched) if there is no such edge
+    bool getEdgeAttributes(int u, int v, double& cost, double& reliability) const {
+        const Edge* edge = findEdge(u, v);
+        if (!edge) return false;
+        cost = edge->cost;
+        reliability = edge->reliability;
+        return true;
     }
     
     // Get edge cost between two nodes
     double getEdgeCost(int u, int v) const {
-        for (const auto& neighbor : getNeighbors(u)) {
-            if (neighbor.first == v) {
-                return neighbor.second.cost;
-            }
+        const Edge* edge = findEdge(u, v);
+        if (edge) {
+            return edge->cost;
         }
         return -1.0; // Not found
     }
     
     // Get edge reliability between two nodes
     double getEdgeReliability(int u, int v) const {
-        for (const auto& neighbor : getNeighbors(u)) {
-            if (neighbor.first == v) {
-                return neighbor.second.reliability;
-            }
+        const Edge* edge = findEdge(u, v);
+        if (edge) {
+            return edge->reliability;
         }
         return 0.0; // Not found
     }
@@ -119,9 +213,15 @@ public:
         return edges;
     }
     
+    // Get the number of dense indices (nodes plus edge-only endpoints),
+    // for sizing arrays indexed by dense index
+    int numIndices() const {
+        return idOfIndex.size();
+    }
+    
     // Get number of nodes
     int numNodes() const {
-        return nodes.size();
+        return nodeIds.size();
     }
     
     // Get number of edges
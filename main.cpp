@@ -8,7 +8,7 @@
  * 4. Computes costs using multi-objective function
  * 5. Outputs results to console and output.json
  * 
- * Compile: g++ -std=c++17 main.cpp -o disaster_relief
+ * Compile: g++ -std=c++17 -O2 -pthread main.cpp -o disaster_relief
  * Run: ./disaster_relief
  */
 
@@ -20,63 +20,113 @@
 #include <fstream>
 #include <sstream>
 #include <string>
+#include <string_view>
 #include <iomanip>
+#include <cstdlib>
+#include <stdexcept>
+#include <algorithm>
+#include <limits>
 
 using namespace std;
 
-// Simple JSON parser for loading input
-// For production, consider using nlohmann/json library
-Graph loadGraphFromJSON(const string& filename) {
-    Graph graph;
-    ifstream file(filename);
+// Read a whole file into memory with a single buffered read
+string readFileContents(const string& filename) {
+    ifstream file(filename, ios::in | ios::binary);
     
     if (!file.is_open()) {
         throw runtime_error("Cannot open file: " + filename);
     }
     
-    string content, line;
-    while (getline(file, line)) {
-        content += line;
+    ostringstream buffer;
+    buffer << file.rdbuf();
+    return buffer.str();
+}
+
+// Parse the numeric value of a field inside text[begin, end) in place,
+// without copying the value into a temporary string
+// Only that range is searched, so a missing optional field costs O(object)
+// Returns defaultValue if the field is not present in that range
+double parseNumberField(const string& text, size_t begin, size_t end,
+                        const string& key, double defaultValue) {
+    string_view object = string_view(text).substr(begin, end - begin);
+    
+    // Look for "key" without building the quoted key as a new string
+    size_t keyPos = object.find(key);
+    while (keyPos != string_view::npos &&
+           (keyPos == 0 || object[keyPos - 1] != '"' ||
+            keyPos + key.size() >= object.size() || object[keyPos + key.size()] != '"')) {
+        keyPos = object.find(key, keyPos + 1);
+    }
+    if (keyPos == string_view::npos) {
+        return defaultValue;
+    }
+    
+    size_t colon = object.find(':', keyPos + key.size());
+    if (colon == string_view::npos) {
+        throw runtime_error("Missing value for field: " + key);
     }
-    file.close();
+    
+    const char* valueStart = text.c_str() + begin + colon + 1;
+    char* valueEnd = nullptr;
+    double value = strtod(valueStart, &valueEnd);
+    if (valueEnd == valueStart) {
+        throw runtime_error("Invalid number for field: " + key);
+    }
+    
+    return value;
+}
+
+// Parse an integer field like parseNumberField, truncating toward zero
+// Throws if the value is NaN or does not fit in an int, rather than
+// relying on an out-of-range double to int conversion
+int parseIntField(const string& text, size_t begin, size_t end,
+                  const string& key, int defaultValue) {
+    double value = parseNumberField(text, begin, end, key, defaultValue);
+    if (!(value > (double)numeric_limits<int>::min() - 1.0 &&
+          value < (double)numeric_limits<int>::max() + 1.0)) {
+        throw runtime_error("Value out of range for field: " + key);
+    }
+    return (int)value;
+}
+
+// Locate the array that follows "key" as content[start, end), where start
+// is the '[' and end the matching ']' (or the end of the text if the array
+// is never closed, so trailing objects are still read)
+// Returns false if the key, or an array after it, is not present
+bool findArrayRange(const string& content, const string& key,
+                    size_t& start, size_t& end) {
+    size_t keyPos = content.find("\"" + key + "\"");
+    if (keyPos == string::npos) return false;
+    
+    start = content.find('[', keyPos);
+    if (start == string::npos) return false;
+    end = content.find(']', start);
+    if (end == string::npos) end = content.size();
+    return true;
+}
+
+// Simple JSON parser for loading input
+// For production, consider using nlohmann/json library
+Graph loadGraphFromJSON(const string& filename) {
+    Graph graph;
+    string content = readFileContents(filename);
     
     // Parse nodes
-    int nodesPos = (int)content.find("\"nodes\"");
-    if (nodesPos != (int)string::npos) {
-        int start = (int)content.find('[', nodesPos);
-        int end = (int)content.find(']', start);
-        string nodesStr = content.substr(start + 1, end - start - 1);
+    size_t start, end;
+    if (findArrayRange(content, "nodes", start, end)) {
+        // Size storage up front from the number of objects in the array
+        graph.reserveNodes((int)count(content.begin() + start, content.begin() + end, '{'));
         
-        int nodeStart = 0;
-        while ((nodeStart = (int)nodesStr.find('{', nodeStart)) != (int)string::npos) {
-            int nodeEnd = (int)nodesStr.find('}', nodeStart);
-            string nodeStr = nodesStr.substr(nodeStart, nodeEnd - nodeStart + 1);
-            
-            int id = 0, demand = 0, priority = 0;
-            
-            // Extract id
-            int idPos = (int)nodeStr.find("\"id\"");
-            if (idPos != (int)string::npos) {
-                int colon = (int)nodeStr.find(':', idPos);
-                int comma = (int)nodeStr.find_first_of(",}", colon);
-                id = stoi(nodeStr.substr(colon + 1, comma - colon - 1));
-            }
+        // Walk the objects of the array in place, without copying them out
+        size_t nodeStart = start + 1;
+        while ((nodeStart = content.find('{', nodeStart)) != string::npos &&
+               nodeStart < end) {
+            size_t nodeEnd = content.find('}', nodeStart);
             
-            // Extract demand
-            int demandPos = (int)nodeStr.find("\"demand\"");
-            if (demandPos != (int)string::npos) {
-                int colon = (int)nodeStr.find(':', demandPos);
-                int comma = (int)nodeStr.find_first_of(",}", colon);
-                demand = stoi(nodeStr.substr(colon + 1, comma - colon - 1));
-            }
-            
-            // Extract priority
-            int priorityPos = (int)nodeStr.find("\"priority\"");
-            if (priorityPos != (int)string::npos) {
-                int colon = (int)nodeStr.find(':', priorityPos);
-                int comma = (int)nodeStr.find_first_of(",}", colon);
-                priority = stoi(nodeStr.substr(colon + 1, comma - colon - 1));
-            }
+            // Extract id, demand and priority
+            int id = parseIntField(content, nodeStart, nodeEnd, "id", 0);
+            int demand = parseIntField(content, nodeStart, nodeEnd, "demand", 0);
+            int priority = parseIntField(content, nodeStart, nodeEnd, "priority", 0);
             
             graph.addNode(Node(id, demand, priority));
             nodeStart = nodeEnd + 1;
@@ -84,51 +134,21 @@ Graph loadGraphFromJSON(const string& filename) {
     }
     
     // Parse edges
-    int edgesPos = (int)content.find("\"edges\"");
-    if (edgesPos != (int)string::npos) {
-        int start = (int)content.find('[', edgesPos);
-        int end = (int)content.find(']', start);
-        string edgesStr = content.substr(start + 1, end - start - 1);
+    if (findArrayRange(content, "edges", start, end)) {
+        // Size storage up front from the number of objects in the array
+        graph.reserveEdges((int)count(content.begin() + start, content.begin() + end, '{'));
         
-        int edgeStart = 0;
-        while ((edgeStart = (int)edgesStr.find('{', edgeStart)) != (int)string::npos) {
-            int edgeEnd = (int)edgesStr.find('}', edgeStart);
-            string edgeStr = edgesStr.substr(edgeStart, edgeEnd - edgeStart + 1);
-            
-            int u = 0, v = 0;
-            double cost = 0.0, reliability = 1.0;
+        // Walk the objects of the array in place, without copying them out
+        size_t edgeStart = start + 1;
+        while ((edgeStart = content.find('{', edgeStart)) != string::npos &&
+               edgeStart < end) {
+            size_t edgeEnd = content.find('}', edgeStart);
             
-            // Extract u
-            int uPos = (int)edgeStr.find("\"u\"");
-            if (uPos != (int)string::npos) {
-                int colon = (int)edgeStr.find(':', uPos);
-                int comma = (int)edgeStr.find(',', colon);
-                u = stoi(edgeStr.substr(colon + 1, comma - colon - 1));
-            }
-            
-            // Extract v
-            int vPos = (int)edgeStr.find("\"v\"");
-            if (vPos != (int)string::npos) {
-                int colon = (int)edgeStr.find(':', vPos);
-                int comma = (int)edgeStr.find(',', colon);
-                v = stoi(edgeStr.substr(colon + 1, comma - colon - 1));
-            }
-            
-            // Extract cost
-            int costPos = (int)edgeStr.find("\"cost\"");
-            if (costPos != (int)string::npos) {
-                int colon = (int)edgeStr.find(':', costPos);
-                int comma = (int)edgeStr.find(',', colon);
-                cost = stod(edgeStr.substr(colon + 1, comma - colon - 1));
-            }
-            
-            // Extract reliability
-            int relPos = (int)edgeStr.find("\"reliability\"");
-            if (relPos != (int)string::npos) {
-                int colon = (int)edgeStr.find(':', relPos);
-                int comma = (int)edgeStr.find_first_of(",}", colon);
-                reliability = stod(edgeStr.substr(colon + 1, comma - colon - 1));
-            }
+            // Extract u, v, cost and reliability
+            int u = parseIntField(content, edgeStart, edgeEnd, "u", 0);
+            int v = parseIntField(content, edgeStart, edgeEnd, "v", 0);
+            double cost = parseNumberField(content, edgeStart, edgeEnd, "cost", 0.0);
+            double reliability = parseNumberField(content, edgeStart, edgeEnd, "reliability", 1.0);
             
             graph.addEdge(Edge(u, v, cost, reliability));
             edgeStart = edgeEnd + 1;
@@ -141,47 +161,20 @@ Graph loadGraphFromJSON(const string& filename) {
 // Load vehicles from JSON file
 vector<Vehicle> loadVehiclesFromJSON(const string& filename) {
     vector<Vehicle> vehicles;
-    ifstream file(filename);
-    
-    if (!file.is_open()) {
-        throw runtime_error("Cannot open file: " + filename);
-    }
-    
-    string content, line;
-    while (getline(file, line)) {
-        content += line;
-    }
-    file.close();
+    string content = readFileContents(filename);
     
     // Parse vehicles
-    int vehiclesPos = (int)content.find("\"vehicles\"");
-    if (vehiclesPos != (int)string::npos) {
-        int start = (int)content.find('[', vehiclesPos);
-        int end = (int)content.find(']', start);
-        string vehiclesStr = content.substr(start + 1, end - start - 1);
-        
-        int vehicleStart = 0;
-        while ((vehicleStart = (int)vehiclesStr.find('{', vehicleStart)) != (int)string::npos) {
-            int vehicleEnd = (int)vehiclesStr.find('}', vehicleStart);
-            string vehicleStr = vehiclesStr.substr(vehicleStart, vehicleEnd - vehicleStart + 1);
-            
-            int id = 0, capacity = 0;
-            
-            // Extract id
-            int idPos = (int)vehicleStr.find("\"id\"");
-            if (idPos != (int)string::npos) {
-                int colon = (int)vehicleStr.find(':', idPos);
-                int comma = (int)vehicleStr.find_first_of(",}", colon);
-                id = stoi(vehicleStr.substr(colon + 1, comma - colon - 1));
-            }
+    size_t start, end;
+    if (findArrayRange(content, "vehicles", start, end)) {
+        // Walk the objects of the array in place, without copying them out
+        size_t vehicleStart = start + 1;
+        while ((vehicleStart = content.find('{', vehicleStart)) != string::npos &&
+               vehicleStart < end) {
+            size_t vehicleEnd = content.find('}', vehicleStart);
             
-            // Extract capacity
-            int capPos = (int)vehicleStr.find("\"capacity\"");
-            if (capPos != (int)string::npos) {
-                int colon = (int)vehicleStr.find(':', capPos);
-                int comma = (int)vehicleStr.find_first_of(",}", colon);
-                capacity = stoi(vehicleStr.substr(colon + 1, comma - colon - 1));
-            }
+            // Extract id and capacity
+            int id = parseIntField(content, vehicleStart, vehicleEnd, "id", 0);
+            int capacity = parseIntField(content, vehicleStart, vehicleEnd, "capacity", 0);
             
             vehicles.push_back(Vehicle(id, capacity));
             vehicleStart = vehicleEnd + 1;
@@ -194,13 +187,16 @@ vector<Vehicle> loadVehiclesFromJSON(const string& filename) {
 // Save results to JSON file
 void saveResultsToJSON(const string& filename,
                       const vector<Vehicle>& vehicles,
-                      const Graph& graph) {
+                      const vector<RouteCost>& costs) {
     ofstream file(filename);
     if (!file.is_open()) {
         cerr << "Cannot create file: " << filename << endl;
         return;
     }
     
+    // All numbers are written with two decimals; set the format once
+    file << fixed << setprecision(2);
+    
     file << "{\n";
     file << "  \"routes\": {\n";
     
@@ -225,12 +221,10 @@ void saveResultsToJSON(const string& filename,
     // Write cost breakdown for each vehicle
     for (int i = 0; i < (int)vehicles.size(); i++) {
         const Vehicle& vehicle = vehicles[i];
-        RouteCost cost = calculateRouteCost(graph, vehicle.route, 
-                                           vehicle.capacity, vehicle.currentLoad);
+        const RouteCost& cost = costs[i];
         
         file << "    \"" << vehicle.id << "\": {\n";
-        file << "      \"total_time\": " << fixed << setprecision(2) 
-             << cost.totalTime << ",\n";
+        file << "      \"total_time\": " << cost.totalTime << ",\n";
         file << "      \"reliability_penalty\": " << cost.reliabilityPenalty << ",\n";
         file << "      \"idle_time\": " << cost.idleTime << ",\n";
         file << "      \"final_score\": " << cost.finalScore << "\n";
@@ -247,38 +241,39 @@ void saveResultsToJSON(const string& filename,
 
 int main() {
     try {
-        cout << "========================================" << endl;
-        cout << "Disaster Response Routing System" << endl;
-        cout << "========================================" << endl << endl;
+        cout << "========================================\n";
+        cout << "Disaster Response Routing System\n";
+        cout << "========================================\n\n";
         
         // Load input from JSON file
-        cout << "Loading input from input.json..." << endl;
+        cout << "Loading input from input.json...\n";
         Graph graph = loadGraphFromJSON("input.json");
         vector<Vehicle> vehicles = loadVehiclesFromJSON("input.json");
         
         cout << "Graph loaded: " << graph.numNodes() << " nodes, " 
-             << graph.numEdges() << " edges" << endl;
-        cout << "Vehicles: " << vehicles.size() << endl << endl;
+             << graph.numEdges() << " edges\n";
+        cout << "Vehicles: " << vehicles.size() << "\n\n";
         
         // Step 1: Allocate vehicles using priority-based greedy algorithm
-        cout << "Step 1: Allocating locations to vehicles..." << endl;
+        cout << "Step 1: Allocating locations to vehicles...\n";
         vehicles = allocateVehicles(graph, vehicles);
         
         // Step 2: Optimize routes using 2-opt
-        cout << "Step 2: Optimizing routes with 2-opt..." << endl;
-        for (auto& vehicle : vehicles) {
-            vehicle.route = twoOpt(graph, vehicle.route);
-        }
+        cout << "Step 2: Optimizing routes with 2-opt...\n";
+        // Routes are independent, so optimize them on the bounded worker pool
+        parallelFor((int)vehicles.size(), [&graph, &vehicles](int i) {
+            vehicles[i].route = twoOpt(graph, vehicles[i].route);
+        });
         
         // Step 3: Calculate and display results
-        cout << "Step 3: Calculating costs..." << endl << endl;
+        cout << "Step 3: Calculating costs...\n\n";
         
-        cout << "========================================" << endl;
-        cout << "SOLUTION" << endl;
-        cout << "========================================" << endl << endl;
+        cout << "========================================\n";
+        cout << "SOLUTION\n";
+        cout << "========================================\n\n";
         
         // Print vehicle assignments
-        cout << "Vehicle Assignments:" << endl;
+        cout << "Vehicle Assignments:\n";
         for (const auto& vehicle : vehicles) {
             cout << "Vehicle " << vehicle.id << ": ";
             bool first = true;
@@ -289,49 +284,58 @@ int main() {
                     first = false;
                 }
             }
-            cout << endl;
+            cout << "\n";
         }
-        cout << endl;
+        cout << "\n";
         
         // Print optimized routes
-        cout << "Optimized Routes:" << endl;
+        cout << "Optimized Routes:\n";
         for (const auto& vehicle : vehicles) {
             cout << "Vehicle " << vehicle.id << " route: ";
             for (int i = 0; i < (int)vehicle.route.size(); i++) {
                 cout << vehicle.route[i];
                 if (i < (int)vehicle.route.size() - 1) cout << " -> ";
             }
-            cout << endl;
+            cout << "\n";
+        }
+        cout << "\n";
+        
+        // Calculate each route's cost once; reused for printing and saving
+        vector<RouteCost> costs;
+        costs.reserve(vehicles.size());
+        for (const auto& vehicle : vehicles) {
+            costs.push_back(calculateRouteCost(graph, vehicle.route, 
+                                               vehicle.capacity, vehicle.currentLoad));
         }
-        cout << endl;
         
         // Print cost breakdown
-        cout << "Cost Breakdown:" << endl;
+        cout << "Cost Breakdown:\n";
+        cout << fixed;
         double totalScore = 0.0;
-        for (const auto& vehicle : vehicles) {
-            RouteCost cost = calculateRouteCost(graph, vehicle.route, 
-                                               vehicle.capacity, vehicle.currentLoad);
+        for (int i = 0; i < (int)vehicles.size(); i++) {
+            const Vehicle& vehicle = vehicles[i];
+            const RouteCost& cost = costs[i];
             totalScore += cost.finalScore;
             
-            cout << "Vehicle " << vehicle.id << ":" << endl;
-            cout << "  Time: " << fixed << setprecision(2) 
-                 << cost.totalTime << endl;
+            cout << "Vehicle " << vehicle.id << ":\n";
+            cout << "  Time: " << setprecision(2) 
+                 << cost.totalTime << "\n";
             cout << "  Reliability Penalty: " << setprecision(4) 
-                 << cost.reliabilityPenalty << endl;
+                 << cost.reliabilityPenalty << "\n";
             cout << "  Idle: " << setprecision(2) 
-                 << cost.idleTime << endl;
+                 << cost.idleTime << "\n";
             cout << "  Final Score: " << setprecision(4) 
-                 << cost.finalScore << endl;
+                 << cost.finalScore << "\n";
         }
-        cout << endl;
-        cout << "Total Score: " << setprecision(4) << totalScore << endl;
-        cout << endl;
+        cout << "\n";
+        cout << "Total Score: " << setprecision(4) << totalScore << "\n";
+        cout << "\n";
         
         // Save results to JSON file
-        cout << "Saving results to output.json..." << endl;
-        saveResultsToJSON("output.json", vehicles, graph);
+        cout << "Saving results to output.json...\n";
+        saveResultsToJSON("output.json", vehicles, costs);
         
-        cout << "Done!" << endl;
+        cout << "Done!\n";
         
     } catch (const exception& e) {
         cerr << "Error: " << e.what() << endl;